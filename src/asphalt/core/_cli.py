@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import os
 import re
-from collections.abc import Mapping, Sequence
-from pathlib import Path
+import sys
+from collections.abc import Callable, Sequence
 from typing import Any
 
 import click
@@ -13,17 +13,52 @@ from yaml import Loader, ScalarNode
 from ._runner import run_application
 from ._utils import merge_config, qualified_name
 
+override_key_re = re.compile(r"(?<!\\)\.")
 
-def env_constructor(loader: Loader, node: ScalarNode) -> str | None:
-    return os.getenv(node.value)
 
+def _read_file_contents(path: str) -> bytes:
+    # Read the whole file with a single read sized from fstat(), avoiding the
+    # chunked reads and buffer reallocations of Path.read_bytes(). O_BINARY keeps the
+    # Windows CRT from translating line endings or treating Ctrl-Z as EOF.
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        contents = os.read(fd, os.fstat(fd).st_size)
+        # Drain the rest in case of a short read or a non-regular file
+        while chunk := os.read(fd, 65536):
+            contents += chunk
+    finally:
+        os.close(fd)
+
+    return contents
+
+
+def env_constructor(
+    loader: Loader,
+    node: ScalarNode,
+    _getenv: Callable[[str], str | None] = os.getenv,
+) -> str | None:
+    return _getenv(node.value)
 
-def text_file_constructor(loader: Loader, node: ScalarNode) -> str:
-    return Path(node.value).read_text()
 
+def text_file_constructor(
+    loader: Loader,
+    node: ScalarNode,
+    _read: Callable[[str], bytes] = _read_file_contents,
+) -> str:
+    # Translate newlines like Path.read_text() would
+    text = _read(node.value).decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
-def binary_file_constructor(loader: Loader, node: ScalarNode) -> bytes:
-    return Path(node.value).read_bytes()
+    return text
+
+
+def binary_file_constructor(
+    loader: Loader,
+    node: ScalarNode,
+    _read: Callable[[str], bytes] = _read_file_contents,
+) -> bytes:
+    return _read(node.value)
 
 
 class AsphaltLoader(Loader):
@@ -65,9 +100,9 @@ def run(configfile: Sequence[str], service: str | None, set_: list[str]) -> None
     config: dict[str, Any] = {}
     for path in configfile:
         config_data = yaml.load(path, AsphaltLoader)
-        assert isinstance(
-            config_data, dict
-        ), "the document root element must be a dictionary"
+        if not isinstance(config_data, dict):
+            raise click.ClickException("the document root element must be a dictionary")
+
         config = merge_config(config, config_data)
 
     # Override config options
@@ -79,11 +114,16 @@ def run(configfile: Sequence[str], service: str | None, set_: list[str]) -> None
 
         key, value = override.split("=", 1)
         parsed_value = yaml.load(value, AsphaltLoader)
-        keys = [k.replace(r"\.", ".") for k in re.split(r"(?<!\\)\.", key)]
+        if "\\." in key:
+            keys = [
+                sys.intern(k.replace(r"\.", ".")) for k in override_key_re.split(key)
+            ]
+        else:
+            keys = [sys.intern(k) for k in key.split(".")]
         section = config
         for i, part_key in enumerate(keys[:-1]):
             section = section.setdefault(part_key, {})
-            if not isinstance(section, Mapping):
+            if not isinstance(section, dict):
                 path = " ⟶ ".join(x for x in keys[: i + 1])
                 raise click.ClickException(
                     f"Cannot apply override for {key!r}: value at {path} is not "
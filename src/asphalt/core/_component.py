@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gc
 import logging
 from abc import ABCMeta, abstractmethod
 from collections.abc import (
@@ -9,11 +10,11 @@ from collections.abc import (
     MutableMapping,
     Sequence,
 )
-from contextlib import AsyncExitStack
+from contextvars import Token
 from enum import Enum, auto
 from inspect import isclass
 from traceback import StackSummary
-from types import FrameType
+from types import FrameType, TracebackType
 from typing import (
     Any,
     Callable,
@@ -25,14 +26,15 @@ from typing import (
 )
 
 from anyio import create_task_group, sleep
-from anyio.abc import TaskGroup
 
 from ._concurrent import ExceptionHandler, TaskFactory, TeardownAction
 from ._context import (
     Context,
+    ContextState,
     FactoryCallback,
     T_Resource,
     TeardownCallback,
+    _current_context,
     current_context,
 )
 from ._exceptions import ComponentStartError, NoCurrentContext, ResourceNotFound
@@ -54,6 +56,8 @@ class Component(metaclass=ABCMeta):
     """This is the base class for all Asphalt components."""
 
     _isolated: ClassVar[bool]
+    _has_prepare: ClassVar[bool] = False
+    _has_start: ClassVar[bool] = False
 
     _child_components: dict[str, dict[str, Any]] | None = None
     _component_started = False
@@ -61,6 +65,8 @@ class Component(metaclass=ABCMeta):
     def __init_subclass__(cls, *, isolated: bool = False, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
         cls._isolated = isolated
+        cls._has_prepare = cls.prepare is not _base_prepare
+        cls._has_start = cls.start is not _base_start
 
     def add_component(
         self, alias: str, /, type: str | type[Component] | None = None, **config: Any
@@ -135,6 +141,12 @@ class Component(metaclass=ABCMeta):
         """
 
 
+# Unbound references to the base class methods, against which __init_subclass__
+# detects overrides
+_base_prepare = Component.prepare
+_base_start = Component.start
+
+
 class CLIApplicationComponent(Component):
     """
     Specialized :class:`.Component` subclass for command line tools.
@@ -163,6 +175,7 @@ class CLIApplicationComponent(Component):
 
 
 component_types = PluginContainer("asphalt.components", Component)
+_resolve_component_type = component_types.resolve
 
 
 class ComponentState(Enum):
@@ -175,6 +188,17 @@ class ComponentState(Enum):
 
 
 class ComponentContext(Context):
+    """
+    A thin per-component facade over the real :class:`Context`.
+
+    Every operation is delegated to the backing context, so this class skips
+    :meth:`Context.__init__` and the full enter/exit machinery; it only tracks
+    the component's own state and makes itself the current context for the
+    duration of the component's startup.
+    """
+
+    _token: Token[Context | None]
+
     def __init__(
         self,
         component: Component,
@@ -182,18 +206,37 @@ class ComponentContext(Context):
         default_resource_name: str,
         child_component_contexts: dict[str, ComponentContext],
     ):
-        super().__init__()
         self.path = path
         self._component = component
         self._default_resource_name = default_resource_name
         self._child_component_contexts = child_component_contexts
         self._component_state: ComponentState = ComponentState.initialized
         self._coro: Coroutine[Any, Any, None] | None = None
+        self._formatted_name = format_component_name(path)
+        self._formatted_name_cap = format_component_name(path, capitalize=True)
+        self._state = ContextState.inactive
         context = current_context()
         if isinstance(context, ComponentContext):
             context = context._context
 
         self._context: Context = context
+        self._parent = context
+
+    async def __aenter__(self) -> ComponentContext:
+        self._ensure_state(ContextState.inactive)
+        self._state = ContextState.open
+        self._token = _current_context.set(self)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool:
+        self._state = ContextState.closed
+        _current_context.reset(self._token)
+        return False
 
     @staticmethod
     def _format_resource_description(
@@ -230,11 +273,14 @@ class ComponentContext(Context):
             description=description,
             teardown_callback=teardown_callback,
         )
-        logger.debug(
-            "%s added a resource (%s)",
-            format_component_name(self.path, capitalize=True),
-            self._format_resource_description(types or type(value), name, description),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s added a resource (%s)",
+                self._formatted_name_cap,
+                self._format_resource_description(
+                    types or type(value), name, description
+                ),
+            )
 
     def add_resource_factory(
         self,
@@ -250,13 +296,16 @@ class ComponentContext(Context):
         self._context.add_resource_factory(
             factory_callback, name, types=types, description=description
         )
-        logger.debug(
-            "%s added a resource factory (%s)",
-            format_component_name(self.path, capitalize=True),
-            self._format_resource_description(
-                types or get_type_hints(factory_callback)["return"], name, description
-            ),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s added a resource factory (%s)",
+                self._formatted_name_cap,
+                self._format_resource_description(
+                    types or get_type_hints(factory_callback)["return"],
+                    name,
+                    description,
+                ),
+            )
 
     @overload
     async def get_resource(
@@ -291,27 +340,33 @@ class ComponentContext(Context):
         if optional:
             return await self._context.get_resource(type, name, optional=True)
 
+        # A factory may legitimately produce None, so a missing resource can only be
+        # told apart from a None value by catching ResourceNotFound
         try:
             return await self._context.get_resource(type, name)
         except ResourceNotFound:
+            pass
+
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "%s is waiting for another component to provide a resource (%s)",
-                format_component_name(self.path, capitalize=True),
+                self._formatted_name_cap,
                 self._format_resource_description(type, name),
             )
 
-            # Wait until a matching resource or resource factory is available
-            await self._context.resource_added.wait_event(
-                lambda event: event.resource_name == name
-                and type in event.resource_types,
-            )
-            res = await self._context.get_resource(type, name)
+        # Wait until a matching resource or resource factory is available
+        await self._context.resource_added.wait_event(
+            lambda event: event.resource_name == name and type in event.resource_types,
+        )
+        res = await self._context.get_resource(type, name)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "%s got the resource it was waiting for (%s)",
-                format_component_name(self.path, capitalize=True),
+                self._formatted_name_cap,
                 self._format_resource_description(type, name),
             )
-            return res
+
+        return res
 
     @overload
     def get_resource_nowait(
@@ -335,10 +390,7 @@ class ComponentContext(Context):
         *,
         optional: Literal[False, True] = False,
     ) -> T_Resource | None:
-        if optional:
-            return self._context.get_resource_nowait(type, name, optional=True)
-
-        return self._context.get_resource_nowait(type, name)
+        return self._context.get_resource_nowait(type, name, optional=optional)
 
     def get_resources(self, type: type[T_Resource]) -> Mapping[str, T_Resource]:
         return self._context.get_resources(type)
@@ -356,7 +408,7 @@ class ComponentContext(Context):
         )
         logger.debug(
             "%s started a background task factory",
-            format_component_name(self.path, capitalize=True),
+            self._formatted_name_cap,
         )
         return factory
 
@@ -372,7 +424,7 @@ class ComponentContext(Context):
         )
         logger.debug(
             "%s started a service task (%s)",
-            format_component_name(self.path, capitalize=True),
+            self._formatted_name_cap,
             name,
         )
         return retval
@@ -430,21 +482,17 @@ async def start_component(
         raise TypeError("config must be a dict (or any other mutable mapping) or None")
 
     root_component_context = _init_component("", {"type": component_class, **config})
-    async with AsyncExitStack() as exit_stack:
-        tg: TaskGroup | None = None
-        if timeout:
-            await exit_stack.enter_async_context(coalesce_exceptions())
-            tg = await exit_stack.enter_async_context(create_task_group())
+    if timeout:
+        async with coalesce_exceptions(), create_task_group() as tg:
             tg.start_soon(
                 _watch_component_tree_startup,
                 root_component_context,
                 timeout,
             )
-
-        await _start_component(root_component_context)
-
-        if tg:
+            await _start_component(root_component_context)
             tg.cancel_scope.cancel()
+    else:
+        await _start_component(root_component_context)
 
     return root_component_context._component
 
@@ -454,62 +502,115 @@ def _init_component(
     config: MutableMapping[str, Any],
     default_resource_name: str = "default",
 ) -> ComponentContext:
-    # Separate the child components from the config
-    child_components_config = config.pop("components", {})
-
-    # Resolve the type to a class
-    component_type = config.pop("type")
-    component_class = component_types.resolve(component_type)
-    if not isclass(component_class) or not issubclass(component_class, Component):
-        raise TypeError(
-            f"{path or '(root)'}: the declared component type ({component_type!r}) "
-            f"resolved to {component_class!r} which is not a subclass of Component"
+    # Instantiate the components iteratively (depth first) instead of recursing, to
+    # avoid burning a Python stack frame per level of nesting. The work items are keyed
+    # by sequence numbers rather than the dotted paths, as an alias containing a dot
+    # (e.g. "a.b") could collide with the path of a nested component ("b" inside "a")
+    components: dict[int, tuple[Component, str, str, list[int]]] = {}
+    stack = [(0, path, config, default_resource_name)]
+    next_key = 1
+    while stack:
+        key, component_path, component_config, resource_name = stack.pop()
+
+        # Separate the child components from the config
+        child_components_config = component_config.pop("components", {})
+
+        # Resolve the type to a class
+        component_type = component_config.pop("type")
+        component_class = _resolve_component_type(component_type)
+        if not isclass(component_class) or not issubclass(component_class, Component):
+            raise TypeError(
+                f"{component_path or '(root)'}: the declared component type "
+                f"({component_type!r}) resolved to {component_class!r} which is not a "
+                f"subclass of Component"
+            )
+
+        # Instantiate the component
+        logger.debug(
+            "Creating %s", format_component_name(component_path, component_class)
         )
+        try:
+            component = component_class(**component_config)
+        except Exception as exc:
+            raise ComponentStartError(
+                "creating", component_path, component_class
+            ) from exc
 
-    # Instantiate the component
-    logger.debug("Creating %s", format_component_name(path, component_class))
-    try:
-        component = component_class(**config)
-    except Exception as exc:
-        raise ComponentStartError("creating", path, component_class) from exc
-
-    # Merge the overrides to the hard-coded configuration
-    logger.debug("Created %s", format_component_name(path, component_class))
-    child_components_config = merge_config(
-        component._child_components, child_components_config
-    )
-
-    # Create the child components
-    child_contexts: dict[str, ComponentContext] = {}
-    for alias, child_config in child_components_config.items():
-        child_path = f"{path}.{alias}" if path else alias
-
-        if child_config is None:
-            child_config = {}
-        elif not isinstance(child_config, MutableMapping):
-            raise TypeError(
-                f"{child_path}: component configuration must be either None or a "
-                f"dict (or any other mutable mapping type), not "
-                f"{qualified_name(child_config)}"
+        # Merge the overrides to the hard-coded configuration, if there is any
+        logger.debug(
+            "Created %s", format_component_name(component_path, component_class)
+        )
+        if component._child_components:
+            child_components_config = merge_config(
+                component._child_components, child_components_config
             )
 
-        # If the type was specified only via an alias, use that as a type
-        child_config.setdefault("type", alias)
+        # Queue the child components for instantiation
+        child_keys: list[int] = []
+        pending: list[tuple[int, str, MutableMapping[str, Any], str]] = []
+        for alias, child_config in child_components_config.items():
+            child_path = f"{component_path}.{alias}" if component_path else alias
+
+            if child_config is None:
+                child_config = {}
+            elif not isinstance(child_config, MutableMapping):
+                raise TypeError(
+                    f"{child_path}: component configuration must be either None or a "
+                    f"dict (or any other mutable mapping type), not "
+                    f"{qualified_name(child_config)}"
+                )
+
+            # If the type was specified only via an alias, use that as a type
+            child_config.setdefault("type", alias)
+
+            # If the type contains a forward slash, split the latter part out of it
+            if isinstance(child_config["type"], str) and "/" in child_config["type"]:
+                child_config["type"] = child_config["type"].split("/")[0]
+
+            if "/" in alias:
+                child_default_resource_name = alias.split("/", 1)[1]
+            else:
+                child_default_resource_name = "default"
+
+            child_keys.append(next_key)
+            pending.append(
+                (next_key, child_path, child_config, child_default_resource_name)
+            )
+            next_key += 1
 
-        # If the type contains a forward slash, split the latter part out of it
-        if isinstance(child_config["type"], str) and "/" in child_config["type"]:
-            child_config["type"] = child_config["type"].split("/")[0]
+        # Reverse so the stack pops the children in their configured order
+        stack.extend(reversed(pending))
+        components[key] = (component, component_path, resource_name, child_keys)
 
-        if "/" in alias:
-            child_default_resource_name = alias.split("/", 1)[1]
-        else:
-            child_default_resource_name = "default"
+    # Wrap the components in contexts, children before parents so that each context
+    # can be handed the contexts of its children
+    contexts: dict[int, ComponentContext] = {}
+    for key, (component, component_path, resource_name, child_keys) in reversed(
+        components.items()
+    ):
+        child_contexts: dict[str, ComponentContext] = {}
+        for child_key in child_keys:
+            child_context = contexts.pop(child_key)
+            child_contexts[child_context.path] = child_context
 
-        child_contexts[child_path] = _init_component(
-            child_path, child_config, child_default_resource_name
+        contexts[key] = ComponentContext(
+            component, component_path, resource_name, child_contexts
         )
 
-    return ComponentContext(component, path, default_resource_name, child_contexts)
+    return contexts[0]
+
+
+_qualified_names: dict[type, str] = {}
+
+
+def _cached_qualified_name(cls: type) -> str:
+    # The set of component classes is small, so memoizing their qualified names
+    # keeps repeated task name/status report formatting cheap
+    try:
+        return _qualified_names[cls]
+    except KeyError:
+        name = _qualified_names[cls] = qualified_name(cls)
+        return name
 
 
 async def _start_component(context: ComponentContext) -> None:
@@ -517,12 +618,15 @@ async def _start_component(context: ComponentContext) -> None:
     component = context._component
     component._component_started = True
     component_class = type(component)
+    _debug = logger.isEnabledFor(logging.DEBUG)
+    formatted_name = context._formatted_name
 
     async with context:
         # Call prepare() on the component itself, if it's implemented on the component
         # class
-        if component_class.prepare is not Component.prepare:
-            logger.debug("Calling prepare() of %s", format_component_name(context.path))
+        if component_class._has_prepare:
+            if _debug:
+                logger.debug("Calling prepare() of %s", formatted_name)
             context._component_state = ComponentState.preparing
             coro = context._coro = component.prepare()
             try:
@@ -532,34 +636,39 @@ async def _start_component(context: ComponentContext) -> None:
                     "preparing", context.path, component_class
                 ) from exc
 
-            logger.debug(
-                "Returned from prepare() of %s", format_component_name(context.path)
-            )
+            if _debug:
+                logger.debug("Returned from prepare() of %s", formatted_name)
+
             context._coro = None
 
         # Start the child components, if there are any
-        if context._child_component_contexts:
-            logger.debug(
-                "Starting the child components of %s",
-                format_component_name(context.path),
-            )
+        if child_contexts := context._child_component_contexts:
+            if _debug:
+                logger.debug("Starting the child components of %s", formatted_name)
+
             context._component_state = ComponentState.starting_children
-            async with coalesce_exceptions(), create_task_group() as tg:
-                for alias, child_context in context._child_component_contexts.items():
-                    tg.start_soon(
-                        _start_component,
-                        child_context,
-                        name=(
+            if len(child_contexts) == 1:
+                # No concurrency to be had with a single child, so skip the task group
+                await _start_component(next(iter(child_contexts.values())))
+            else:
+                async with coalesce_exceptions(), create_task_group() as tg:
+                    for child_context in child_contexts.values():
+                        # Only build descriptive task names when they can show up in
+                        # logs
+                        name = (
                             f"Starting component {child_context.path} "
-                            f"({qualified_name(child_context._component)})"
-                        ),
-                    )
+                            f"({_cached_qualified_name(type(child_context._component))})"
+                            if _debug
+                            else None
+                        )
+                        tg.start_soon(_start_component, child_context, name=name)
 
         # Call start() on the component itself, if it's implemented on the component
         # class
-        if component_class.start is not Component.start:
+        if component_class._has_start:
             context._component_state = ComponentState.starting
-            logger.debug("Calling start() of %s", format_component_name(context.path))
+            if _debug:
+                logger.debug("Calling start() of %s", formatted_name)
             coro = context._coro = component.start()
             context._component_state = ComponentState.starting
             try:
@@ -569,9 +678,9 @@ async def _start_component(context: ComponentContext) -> None:
                     "starting", context.path, component_class
                 ) from exc
 
-            logger.debug(
-                "Returned from start() of %s", format_component_name(context.path)
-            )
+            if _debug:
+                logger.debug("Returned from start() of %s", formatted_name)
+
             context._coro = None
 
         context._component_state = ComponentState.started
@@ -597,7 +706,10 @@ async def _watch_component_tree_startup(
         if subcontext._coro is not None:
             stack_summary = _get_coro_stack_summary(subcontext._coro)
             formatted_summary = "".join(stack_summary.format())
-            title = f"{subcontext.path} ({qualified_name(subcontext._component)})"
+            title = (
+                f"{subcontext.path} "
+                f"({_cached_qualified_name(type(subcontext._component))})"
+            )
             summaries.append(f"{title}:\n{formatted_summary.rstrip()}")
 
         for child_context in subcontext._child_component_contexts.values():
@@ -624,8 +736,6 @@ async def _watch_component_tree_startup(
 
 
 def _get_coro_stack_summary(coro: Coroutine[Any, Any, Any]) -> StackSummary:
-    import gc
-
     frames: list[FrameType] = []
     awaitable: Awaitable[Any] | None = coro
     while isinstance(awaitable, Coroutine):
@@ -187,8 +187,9 @@ class Context:
         if self._parent is not None:
             from ._component import ComponentContext
 
-            # Don't set a ComponentContext as parent as they exit sooner
-            while isinstance(self._parent, ComponentContext):
+            # Don't set a ComponentContext as parent as they exit sooner; its
+            # _context attribute always points to the real backing context
+            if isinstance(self._parent, ComponentContext):
                 self._parent = self._parent._context
 
             self._resources = {
@@ -396,7 +397,8 @@ class Context:
             self.add_teardown_callback(teardown_callback)
 
         # Notify listeners that a new resource has been made available
-        self.resource_added.dispatch(ResourceEvent(types_, name, description, False))
+        if (signal := self.resource_added).has_subscribers:
+            signal.dispatch(ResourceEvent(types_, name, description, False))
 
     def add_resource_factory(
         self,
@@ -487,9 +489,8 @@ class Context:
             self._resource_factories[(type_, name)] = resource
 
         # Notify listeners that a new resource has been made available
-        self.resource_added.dispatch(
-            ResourceEvent(resource_types, name, description, True)
-        )
+        if (signal := self.resource_added).has_subscribers:
+            signal.dispatch(ResourceEvent(resource_types, name, description, True))
 
     @overload
     def get_resource_nowait(
@@ -556,9 +557,10 @@ class Context:
                 self._resources[(type_, factory.name)] = container
 
             # Dispatch the resource_added event to notify any listeners
-            self.resource_added.dispatch(
-                ResourceEvent(factory.types, name, factory.description, False)
-            )
+            if (signal := self.resource_added).has_subscribers:
+                signal.dispatch(
+                    ResourceEvent(factory.types, name, factory.description, False)
+                )
 
             return cast(T_Resource, generated_resource)
 
@@ -631,9 +633,10 @@ class Context:
                 self._resources[(type_, factory.name)] = container
 
             # Dispatch the resource_added event to notify any listeners
-            self.resource_added.dispatch(
-                ResourceEvent(factory.types, name, factory.description, False)
-            )
+            if (signal := self.resource_added).has_subscribers:
+                signal.dispatch(
+                    ResourceEvent(factory.types, name, factory.description, False)
+                )
 
             return cast(T_Resource, generated_resource)
 
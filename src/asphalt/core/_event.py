@@ -109,6 +109,11 @@ class Signal(Generic[T_Event]):
     def __set_name__(self, owner: Any, name: str) -> None:
         self._topic = name
 
+    @property
+    def has_subscribers(self) -> bool:
+        """Return ``True`` if the signal currently has any subscribers."""
+        return bool(self._send_streams)
+
     def _check_is_bound_signal(self) -> None:
         if not hasattr(self, "_instance"):
             raise UnboundSignal
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import platform
 import signal
 import sys
 from functools import partial
@@ -28,6 +27,9 @@ from ._utils import qualified_name
 
 logger = getLogger("asphalt.core")
 
+_exit_code_out_of_range_msg = "exit code out of range: %d"
+_bad_exit_code_type_msg = "run() must return an integer or None, not %s"
+
 
 async def handle_signals(
     startup_scope: CancelScope, event: Event, *, task_status: TaskStatus[None]
@@ -60,7 +62,7 @@ async def _run_application_async(
         event = Event()
         async with Context():
             with CancelScope() as startup_scope:
-                if platform.system() != "Windows":
+                if sys.platform != "win32":
                     await start_service_task(
                         partial(handle_signals, startup_scope, event),
                         "Asphalt signal handler",
@@ -86,13 +88,10 @@ async def _run_application_async(
                     if 0 <= exit_code <= 127:
                         return exit_code
                     else:
-                        warn(f"exit code out of range: {exit_code}")
+                        warn(_exit_code_out_of_range_msg % exit_code)
                         return 1
                 elif exit_code is not None:
-                    warn(
-                        f"run() must return an integer or None, not "
-                        f"{qualified_name(exit_code.__class__)}"
-                    )
+                    warn(_bad_exit_code_type_msg % qualified_name(exit_code.__class__))
                     return 1
             else:
                 await event.wait()
@@ -103,7 +103,10 @@ def merge_config(
         loggers).
 
     """
-    copied = dict(original) if original else {}
+    if not original:
+        return dict(overrides) if overrides else {}
+
+    copied = dict(original)
     if overrides:
         for key, value in overrides.items():
             orig_value = copied.get(key)
@@ -187,16 +190,17 @@ class PluginContainer:
         """
         if not isinstance(obj, str):
             return obj
-        elif ":" in obj:
-            return resolve_reference(obj)
         elif obj in self._resolved:
             return self._resolved[obj]
+        elif ":" in obj:
+            value = self._resolved[obj] = resolve_reference(obj)
+            return value
 
-        value = self._entrypoints.get(obj)
-        if value is None:
+        entrypoint = self._entrypoints.get(obj)
+        if entrypoint is None:
             raise LookupError(f"no such entry point in {self.namespace}: {obj}")
 
-        value = self._resolved[obj] = value.load()
+        value = self._resolved[obj] = entrypoint.load()
         return value
 
     def create_object(self, type: type | str, **constructor_kwargs: Any) -> Any:
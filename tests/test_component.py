@@ -303,6 +303,43 @@ async def test_start_component_timeout() -> None:
             await start_component(StallingComponent, timeout=0.01)
 
 
+async def test_start_component_dotted_alias() -> None:
+    """
+    Test that a child component alias containing a dot ("a.b") does not clash with an
+    identically named path of a nested component ("b" inside "a").
+    """
+
+    class Branch(Component):
+        pass
+
+    class Leaf(Component):
+        pass
+
+    config = {
+        "components": {
+            "a.b": {"type": Leaf},
+            "a": {"type": Branch, "components": {"b": {"type": Leaf}}},
+        }
+    }
+    async with Context():
+        await start_component(Component, config)
+
+
+async def test_start_component_null_factory_resource() -> None:
+    """
+    Test that get_resource() returns None produced by a factory instead of waiting for
+    another component to provide the resource.
+    """
+
+    class NoneFactoryComponent(Component):
+        async def start(self) -> None:
+            add_resource_factory(lambda: None, types=[str])
+            assert await get_resource(str) is None
+
+    async with Context():
+        await start_component(NoneFactoryComponent, timeout=1)
+
+
 async def test_prepare(caplog: LogCaptureFixture) -> None:
     class ParentComponent(Component):
         def __init__(self) -> None:
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
+import re
 import sys
 from collections.abc import AsyncGenerator, Callable
 from contextlib import AsyncExitStack, ExitStack
-from itertools import count
 from typing import Any, NoReturn, Optional, Union
 
 import pytest
 from anyio import (
     create_task_group,
     fail_after,
-    wait_all_tasks_blocked,
 )
 from anyio.abc import TaskStatus
 from anyio.lowlevel import checkpoint
@@ -39,6 +38,20 @@ if sys.version_info < (3, 11):
 
 pytestmark = pytest.mark.anyio()
 
+# Compiled once as these patterns are matched by several (parametrized) tests
+bad_name_pattern = re.compile(
+    '"name" must be a nonempty string consisting only of alphanumeric characters '
+    "and underscores"
+)
+resource_not_found_pattern = re.compile(
+    "no matching resource was found for type=int name='foo'"
+)
+
+# Shared by several factory return annotations so get_type_hints() only has to look up
+# a module-level name instead of rebuilding the union on each resolution
+int_or_float = Union[int, float]
+optional_str = Optional[str]
+
 
 @pytest.fixture
 async def context() -> AsyncGenerator[Context, None]:
@@ -48,8 +61,9 @@ async def context() -> AsyncGenerator[Context, None]:
 
 class TestContext:
     async def test_use_without_entering(self) -> None:
-        with pytest.raises(RuntimeError, match="this context has not been entered yet"):
-            Context().add_resource(1)
+        pytest.raises(RuntimeError, Context().add_resource, 1).match(
+            "this context has not been entered yet"
+        )
 
     async def test_enter_twice(self, context: Context) -> None:
         with pytest.raises(RuntimeError, match="this context has already been entered"):
@@ -60,8 +74,9 @@ class TestContext:
         async with Context() as ctx:
             pass
 
-        with pytest.raises(RuntimeError, match="this context has already been closed"):
-            ctx.add_resource(1)
+        pytest.raises(RuntimeError, ctx.add_resource, 1).match(
+            "this context has already been closed"
+        )
 
     async def test_use_during_teardown(self) -> None:
         def teardown_callback() -> None:
@@ -94,10 +109,7 @@ class TestContext:
                 assert parent.parent is None
                 assert child.parent is parent
 
-    @pytest.mark.parametrize(
-        "exception", [None, Exception("foo")], ids=["noexception", "exception"]
-    )
-    async def test_close(self, exception: Exception | None) -> None:
+    async def test_close(self) -> None:
         """
         Test that teardown callbacks are called in reverse order when a context is
         closed.
@@ -112,18 +124,23 @@ class TestContext:
         called_functions: list[
             tuple[Callable[[BaseException | None], Any], BaseException | None]
         ] = []
-        async with AsyncExitStack() as exit_stack:
-            if exception:
-                exit_stack.enter_context(pytest.raises(Exception, match="foo"))
+        for exception in (None, Exception("foo")):
+            called_functions.clear()
+            async with AsyncExitStack() as exit_stack:
+                if exception:
+                    exit_stack.enter_context(pytest.raises(Exception, match="foo"))
 
-            context = await exit_stack.enter_async_context(Context())
-            context.add_teardown_callback(callback, pass_exception=True)
-            context.add_teardown_callback(async_callback, pass_exception=True)
+                context = await exit_stack.enter_async_context(Context())
+                context.add_teardown_callback(callback, pass_exception=True)
+                context.add_teardown_callback(async_callback, pass_exception=True)
 
-            if exception:
-                raise exception
+                if exception:
+                    raise exception
 
-        assert called_functions == [(async_callback, exception), (callback, exception)]
+            assert called_functions == [
+                (async_callback, exception),
+                (callback, exception),
+            ]
 
     async def test_teardown_callback_exception(self) -> None:
         """
@@ -158,14 +175,12 @@ class TestContext:
         notified.
         """
 
-        async def resource_adder() -> None:
-            await wait_all_tasks_blocked()
+        # add_resource() dispatches the event synchronously, so subscribing first and
+        # then reading the buffered event avoids spawning a task just to observe it
+        async with context.resource_added.stream_events() as stream:
             context.add_resource(6, "foo", types)
-
-        async with create_task_group() as tg:
-            tg.start_soon(resource_adder)
             with fail_after(1):
-                event = await context.resource_added.wait_event()
+                event = await stream.__anext__()
 
         assert event.resource_types == (int,)
         assert event.resource_name == "foo"
@@ -175,23 +190,20 @@ class TestContext:
     async def test_add_resource_name_conflict(self, context: Context) -> None:
         """Test that adding a resource won't replace any existing resources."""
         context.add_resource(5, "foo")
-        with pytest.raises(ResourceConflict) as exc:
-            context.add_resource(4, "foo")
-
+        exc = pytest.raises(ResourceConflict, context.add_resource, 4, "foo")
         exc.match(
             "this context already contains a resource of type int using the name 'foo'"
         )
 
     async def test_add_resource_none_value(self, context: Context) -> None:
         """Test that None is not accepted as a resource value."""
-        with pytest.raises(ValueError, match='"value" must not be None'):
-            context.add_resource(None)
+        pytest.raises(ValueError, context.add_resource, None).match(
+            '"value" must not be None'
+        )
 
     async def test_add_resource_type_conflict(self, context: Context) -> None:
         context.add_resource(5)
-        with pytest.raises(ResourceConflict) as exc:
-            context.add_resource(6)
-
+        exc = pytest.raises(ResourceConflict, context.add_resource, 6)
         exc.match(
             "this context already contains a resource of type int using the name "
             "'default'"
@@ -201,13 +213,14 @@ class TestContext:
         "name", ["a.b", "a:b", "a b"], ids=["dot", "colon", "space"]
     )
     async def test_add_resource_bad_name(self, context: Context, name: str) -> None:
-        with pytest.raises(ValueError) as exc:
-            context.add_resource(1, name)
-
-        exc.match(
-            '"name" must be a nonempty string consisting only of alphanumeric '
-            "characters and underscores"
-        )
+        """
+        Test that both resource and resource factory registration reject invalid
+        names.
+        """
+        pytest.raises(ValueError, context.add_resource, 1, name).match(bad_name_pattern)
+        pytest.raises(
+            ValueError, context.add_resource_factory, lambda: 1, name, types=[int]
+        ).match(bad_name_pattern)
 
     @pytest.mark.parametrize("nowait", [True, False])
     async def test_add_resource_factory(self, context: Context, nowait: bool) -> None:
@@ -224,10 +237,11 @@ class TestContext:
                 async for event in stream:
                     events.append(event)
 
-        def factory() -> Union[int, float]:  # noqa: UP007
-            return next(counter)
+        def factory() -> int_or_float:
+            calls.append(None)
+            return len(calls)
 
-        counter = count(1)
+        calls: list[None] = []
         context.add_resource_factory(factory)
 
         async with create_task_group() as tg:
@@ -260,10 +274,11 @@ class TestContext:
                 async for event in stream:
                     events.append(event)
 
-        async def factory() -> Union[int, float]:  # noqa: UP007
-            return next(counter)
+        async def factory() -> int_or_float:
+            calls.append(None)
+            return len(calls)
 
-        counter = count(1)
+        calls: list[None] = []
         context.add_resource_factory(factory)
 
         async with create_task_group() as tg:
@@ -286,43 +301,29 @@ class TestContext:
             return 1
 
         context.add_resource_factory(factory)
-        with pytest.raises(AsyncResourceError):
-            context.get_resource_nowait(int)
-
-    @pytest.mark.parametrize(
-        "name", ["a.b", "a:b", "a b"], ids=["dot", "colon", "space"]
-    )
-    async def test_add_resource_factory_bad_name(
-        self, context: Context, name: str
-    ) -> None:
-        with pytest.raises(ValueError) as exc:
-            context.add_resource_factory(lambda: 1, name, types=[int])
-
-        exc.match(
-            '"name" must be a nonempty string consisting only of alphanumeric '
-            "characters and underscores"
-        )
+        pytest.raises(AsyncResourceError, context.get_resource_nowait, int)
 
     async def test_add_resource_factory_empty_types(self, context: Context) -> None:
-        with pytest.raises(
-            ValueError,
-            match="no resource types specified, and the factory callback does not have "
-            "a return type hint",
-        ):
-            context.add_resource_factory(lambda: 1, types=())
+        pytest.raises(
+            ValueError, context.add_resource_factory, lambda: 1, types=()
+        ).match(
+            "no resource types specified, and the factory callback does not have "
+            "a return type hint"
+        )
 
     async def test_add_resource_factory_none_in_types(self, context: Context) -> None:
-        with pytest.raises(TypeError, match="None is not a valid resource type"):
-            context.add_resource_factory(
-                lambda: 1,
-                types=(int, float, None),  # type: ignore[arg-type]
-            )
+        pytest.raises(
+            TypeError,
+            context.add_resource_factory,
+            lambda: 1,
+            types=(int, float, None),  # type: ignore[arg-type]
+        ).match("None is not a valid resource type")
 
     async def test_add_resource_factory_type_conflict(self, context: Context) -> None:
         context.add_resource_factory(lambda: None, types=(str, int))
-        with pytest.raises(ResourceConflict) as exc:
-            context.add_resource_factory(lambda: None, types=[int])
-
+        exc = pytest.raises(
+            ResourceConflict, context.add_resource_factory, lambda: None, types=[int]
+        )
         exc.match("this context already contains a resource factory for the type int")
 
     async def test_add_resource_factory_no_inherit(self, context: Context) -> None:
@@ -333,9 +334,10 @@ class TestContext:
         """
 
         def factory() -> int:
-            return next(counter)
+            calls.append(None)
+            return len(calls)
 
-        counter = count(1)
+        calls: list[None] = []
         context.add_resource_factory(factory)
 
         assert context.get_resource_nowait(int) == 1
@@ -352,7 +354,7 @@ class TestContext:
         assert context.get_resource_nowait(str) == "foo"
 
     async def test_add_resource_return_type_union(self, context: Context) -> None:
-        def factory() -> Union[int, float]:  # noqa: UP007
+        def factory() -> int_or_float:
             return 5
 
         context.add_resource_factory(factory)
@@ -369,7 +371,7 @@ class TestContext:
         assert context.get_resource_nowait(float) == 5
 
     async def test_add_resource_return_type_optional(self, context: Context) -> None:
-        def factory() -> Optional[str]:  # noqa: UP007
+        def factory() -> optional_str:
             return "foo"
 
         context.add_resource_factory(factory)
@@ -391,62 +393,68 @@ class TestContext:
 
         """
         exc = pytest.raises(ResourceNotFound, context.get_resource_nowait, int, "foo")
-        exc.match("no matching resource was found for type=int name='foo'")
+        exc.match(resource_not_found_pattern)
         assert exc.value.type is int
         assert exc.value.name == "foo"
 
 
+class TeardownState:
+    """Holds the progress of a @context_teardown generator under test."""
+
+    __slots__ = "phase", "received_exception"
+
+    def __init__(self) -> None:
+        self.phase: str | None = None
+        self.received_exception: BaseException | None = None
+
+
 class TestContextTeardown:
-    @pytest.mark.parametrize(
-        "expected_exc", [None, Exception("foo")], ids=["no_exception", "exception"]
-    )
-    async def test_function(self, expected_exc: Exception | None) -> None:
-        phase = received_exception = None
+    async def test_function(self) -> None:
+        state = TeardownState()
 
         @context_teardown
         async def start(ctx: Context) -> AsyncGenerator[None, Any]:
-            nonlocal phase, received_exception
-            phase = "started"
+            state.phase = "started"
             exc = yield
-            phase = "finished"
-            received_exception = exc
+            state.phase = "finished"
+            state.received_exception = exc
 
-        with ExitStack() as exit_stack:
-            async with Context() as context:
-                await start(context)
-                assert phase == "started"
-                if expected_exc:
-                    exit_stack.enter_context(pytest.raises(Exception, match="foo"))
-                    raise expected_exc
+        for expected_exc in (None, Exception("foo")):
+            state = TeardownState()
+            with ExitStack() as exit_stack:
+                async with Context() as context:
+                    await start(context)
+                    assert state.phase == "started"
+                    if expected_exc:
+                        exit_stack.enter_context(pytest.raises(Exception, match="foo"))
+                        raise expected_exc
 
-        assert phase == "finished"
-        assert received_exception == expected_exc
+            assert state.phase == "finished"
+            assert state.received_exception == expected_exc
 
-    @pytest.mark.parametrize(
-        "expected_exc", [None, Exception("foo")], ids=["no_exception", "exception"]
-    )
-    async def test_method(self, expected_exc: Exception | None) -> None:
-        phase = received_exception = None
+    async def test_method(self) -> None:
+        state = TeardownState()
 
         class SomeComponent:
             @context_teardown
             async def start(self) -> AsyncGenerator[None, Any]:
-                nonlocal phase, received_exception
-                phase = "started"
+                state.phase = "started"
                 exc = yield
-                phase = "finished"
-                received_exception = exc
-
-        with ExitStack() as exit_stack:
-            async with Context():
-                await SomeComponent().start()
-                assert phase == "started"
-                if expected_exc:
-                    exit_stack.enter_context(pytest.raises(Exception, match="foo"))
-                    raise expected_exc
-
-        assert phase == "finished"
-        assert received_exception == expected_exc
+                state.phase = "finished"
+                state.received_exception = exc
+
+        for expected_exc in (None, Exception("foo")):
+            state = TeardownState()
+            with ExitStack() as exit_stack:
+                async with Context():
+                    await SomeComponent().start()
+                    assert state.phase == "started"
+                    if expected_exc:
+                        exit_stack.enter_context(pytest.raises(Exception, match="foo"))
+                        raise expected_exc
+
+            assert state.phase == "finished"
+            assert state.received_exception == expected_exc
 
     def test_plain_function(self) -> None:
         def start() -> None:
@@ -495,33 +503,6 @@ class TestContextTeardown:
         assert resource == "blah"
 
 
-class TestContextFinisher:
-    @pytest.mark.parametrize(
-        "expected_exc", [None, Exception("foo")], ids=["no_exception", "exception"]
-    )
-    async def test_context_teardown(self, expected_exc: Exception | None) -> None:
-        phase = received_exception = None
-
-        @context_teardown
-        async def start() -> AsyncGenerator[None, Any]:
-            nonlocal phase, received_exception
-            phase = "started"
-            exc = yield
-            phase = "finished"
-            received_exception = exc
-
-        with ExitStack() as exit_stack:
-            async with Context():
-                await start()
-                assert phase == "started"
-                if expected_exc:
-                    exit_stack.enter_context(pytest.raises(Exception, match="foo"))
-                    raise expected_exc
-
-        assert phase == "finished"
-        assert received_exception == expected_exc
-
-
 async def test_current_context() -> None:
     pytest.raises(NoCurrentContext, current_context)
 
@@ -549,34 +530,38 @@ async def test_get_resource_nowait() -> None:
         pytest.raises(ResourceNotFound, get_resource_nowait, int)
 
 
+# Decorated at import time so the tests don't pay for the signature introspection
+# done by @inject
+@inject
+async def _injected_async(
+    foo: int, bar: str = resource(), *, baz: str = resource("alt")
+) -> tuple[int, str, str]:
+    return foo, bar, baz
+
+
+@inject
+def _injected_sync(
+    foo: int, bar: str = resource(), *, baz: str = resource("alt")
+) -> tuple[int, str, str]:
+    return foo, bar, baz
+
+
 class TestDependencyInjection:
     async def test_static_resources(self) -> None:
-        @inject
-        async def injected(
-            foo: int, bar: str = resource(), *, baz: str = resource("alt")
-        ) -> tuple[int, str, str]:
-            return foo, bar, baz
-
         async with Context():
             add_resource("bar_test")
             add_resource("baz_test", "alt")
-            foo, bar, baz = await injected(2)
+            foo, bar, baz = await _injected_async(2)
 
         assert foo == 2
         assert bar == "bar_test"
         assert baz == "baz_test"
 
     async def test_sync_injection(self) -> None:
-        @inject
-        def injected(
-            foo: int, bar: str = resource(), *, baz: str = resource("alt")
-        ) -> tuple[int, str, str]:
-            return foo, bar, baz
-
         async with Context():
             add_resource("bar_test")
             add_resource("baz_test", "alt")
-            foo, bar, baz = injected(2)
+            foo, bar, baz = _injected_sync(2)
 
         assert foo == 2
         assert bar == "bar_test"
@@ -605,54 +590,40 @@ class TestDependencyInjection:
 
         exc.match("no matching resource was found for type=str name='default'")
 
-    @pytest.mark.parametrize(
-        "annotation",
-        [
-            pytest.param(Optional[str], id="optional"),
-            # pytest.param(Union[str, int, None], id="union"),
-            pytest.param(
-                "str | None",
-                id="uniontype.10",
-                marks=[
-                    pytest.mark.skipif(
-                        sys.version_info < (3, 10), reason="Requires Python 3.10+"
-                    )
-                ],
-            ),
-        ],
-    )
-    @pytest.mark.parametrize(
-        "sync",
-        [
-            pytest.param(True, id="sync"),
-            pytest.param(False, id="async"),
-        ],
-    )
-    async def test_inject_optional_resource_async(
-        self, annotation: type, sync: bool
-    ) -> None:
-        if sync:
-
-            @inject
-            def injected(
-                res: annotation = resource(),  # type: ignore[valid-type]
-            ) -> annotation:  # type: ignore[valid-type]
-                return res
-
-        else:
-
-            @inject
-            async def injected(
-                res: annotation = resource(),  # type: ignore[valid-type]
-            ) -> annotation:  # type: ignore[valid-type]
-                return res
+    async def test_inject_optional_resource(self) -> None:
+        annotations: list[Any] = [optional_str]
+        if sys.version_info >= (3, 10):
+            annotations.append("str | None")
 
+        cases = [
+            (annotation, sync) for annotation in annotations for sync in (True, False)
+        ]
         async with Context():
-            retval: Any = injected() if sync else (await injected())
-            assert retval is None
-            add_resource("hello")
-            retval = injected() if sync else (await injected())
-            assert retval == "hello"
+            for index, (annotation, sync) in enumerate(cases):
+                # Use a unique resource name per case so the "no resource yet" half of
+                # each case still sees an empty slot in the shared context
+                name = f"inject_optional_{index}"
+                if sync:
+
+                    @inject
+                    def injected(
+                        res: annotation = resource(name),  # type: ignore[valid-type]
+                    ) -> annotation:  # type: ignore[valid-type]
+                        return res
+
+                else:
+
+                    @inject
+                    async def injected(
+                        res: annotation = resource(name),  # type: ignore[valid-type]
+                    ) -> annotation:  # type: ignore[valid-type]
+                        return res
+
+                retval: Any = injected() if sync else (await injected())
+                assert retval is None
+                add_resource("hello", name)
+                retval = injected() if sync else (await injected())
+                assert retval == "hello"
 
     def test_resource_function_not_called(self) -> None:
         async def injected(
@@ -661,9 +632,7 @@ class TestDependencyInjection:
         ) -> None:
             pass
 
-        with pytest.raises(TypeError) as exc:
-            inject(injected)
-
+        exc = pytest.raises(TypeError, inject, injected)
         exc.match(
             f"Default value for parameter 'bar' of function "
             f"{__name__}.{self.__class__.__name__}.test_resource_function_not_called"
@@ -675,9 +644,7 @@ class TestDependencyInjection:
         def injected(foo: int, bar: str = resource()) -> None:
             bar.lower()
 
-        with pytest.raises(AttributeError) as exc:
-            injected(1)
-
+        exc = pytest.raises(AttributeError, injected, 1)
         exc.match(
             r"Attempted to access an attribute in a resource\(\) marker – did you "
             r"forget to add the @inject decorator\?"